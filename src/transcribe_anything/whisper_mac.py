@@ -56,16 +56,15 @@ def get_environment() -> IsoEnv:
     return env
 
 
+_SRT_TIMESTAMP_FMT = "%02d:%02d:%02d,%03d"
+
+
 def _format_timestamp(seconds: float) -> str:
     """Format seconds into SRT timestamp format."""
-    milliseconds = int(seconds * 1000)
-    hours = milliseconds // 3_600_000
-    milliseconds -= hours * 3_600_000
-    minutes = milliseconds // 60_000
-    milliseconds -= minutes * 60_000
-    seconds = milliseconds // 1_000
-    milliseconds -= seconds * 1_000
-    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{milliseconds:03d}"
+    hours, rem = divmod(int(seconds * 1000), 3_600_000)
+    minutes, rem = divmod(rem, 60_000)
+    secs, millis = divmod(rem, 1_000)
+    return _SRT_TIMESTAMP_FMT % (hours, minutes, secs, millis)
 
 
 # Constants for timestamp conversion
@@ -76,22 +75,38 @@ FRAME_HOP_SECONDS = 0.01
 
 def _json_to_srt(json_data: Dict[str, Any]) -> str:
     """Convert lightning-whisper-mlx JSON output to SRT format."""
-    srt_content = ""
+    srt_content, _ = _json_to_srt_with_count(json_data)
+    return srt_content
+
 
+def _json_to_srt_with_count(json_data: Dict[str, Any]) -> tuple[str, int]:
+    """Convert lightning-whisper-mlx JSON output to SRT format.
+
+    Returns the SRT content together with the number of subtitle blocks written,
+    so callers don't have to re-scan the content to count them. Block numbers
+    follow the segment position and skip dropped segments, so the count is not
+    necessarily the index of the last block.
+    """
     if "segments" not in json_data:
         # If no segments, try to create a single segment from the full text
         if "text" in json_data:
-            srt_content = "1\n00:00:00,000 --> 00:01:00,000\n" + json_data["text"] + "\n\n"
-        return srt_content
+            return "1\n00:00:00,000 --> 00:01:00,000\n" + json_data["text"] + "\n\n", 1
+        return "", 0
 
+    # Collect the blocks and join once, repeated += is quadratic on long transcripts
+    parts: list[str] = []
+    format_timestamp = _format_timestamp
     for i, segment in enumerate(json_data["segments"], start=1):
         # Handle both old format (start/end) and new format (list with start, end, text)
+        # Empty segments are dropped before any timestamp work is done.
         if isinstance(segment, list) and len(segment) >= 3:
             # New format: [start_seek, end_seek, text]
+            text = segment[2].strip()
+            if not text:
+                continue
             # Convert mel frame indices to seconds using correct conversion factor
             start_time = segment[0] * FRAME_HOP_SECONDS
             end_time = segment[1] * FRAME_HOP_SECONDS
-            text = segment[2].strip()
 
             # Sanity check for timestamp ordering
             if end_time < start_time:
@@ -99,16 +114,15 @@ def _json_to_srt(json_data: Dict[str, Any]) -> str:
                 continue
         else:
             # Old format: dict with start/end/text (already in seconds)
+            text = segment.get("text", "").strip()
+            if not text:
+                continue
             start_time = segment.get("start", 0)
             end_time = segment.get("end", start_time + 5)  # Default to 5 seconds if no end time
-            text = segment.get("text", "").strip()
 
-        if text:  # Only include non-empty segments
-            srt_content += f"{i}\n"
-            srt_content += f"{_format_timestamp(start_time)} --> {_format_timestamp(end_time)}\n"
-            srt_content += f"{text}\n\n"
+        parts.append(f"{i}\n{format_timestamp(start_time)} --> {format_timestamp(end_time)}\n{text}\n\n")
 
-    return srt_content
+    return "".join(parts), len(parts)
 
 
 def _generate_output_files(json_data: Dict[str, Any], output_dir: Path, initial_prompt: str | None = None) -> None:
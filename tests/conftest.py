@@ -0,0 +1,36 @@
+"""
+Shared pytest fixtures.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from transcribe_anything.util import is_mac_arm
+
+HERE = Path(__file__).parent
+TEST_WAV = HERE / "localfile" / "video.wav"
+
+
+@pytest.fixture(scope="session")
+def mlx_output_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Transcribe TEST_WAV with the MLX backend once per test session.
+
+    The English "small" model run is shared by every test that only inspects
+    its outputs, since the transcription dominates the cost of the MLX tests.
+    Skips on non Mac ARM machines so no consumer can trigger the MLX install.
+    """
+    if not is_mac_arm():
+        pytest.skip("Not mac")
+    # Imported here so sessions without MLX tests never import the backend.
+    from transcribe_anything.whisper_mac import run_whisper_mac_mlx  # pylint: disable=import-outside-toplevel
+
+    out_dir = tmp_path_factory.mktemp("mlx_once")
+    run_whisper_mac_mlx(
+        input_wav=TEST_WAV,
+        model="small",
+        output_dir=out_dir,
+        language="en",
+        task="transcribe",
+    )
+    return out_dir
@@ -7,80 +7,91 @@ Tests transcribe_anything with lightning-whisper-mlx (MLX backend)
 
 import os
 import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
+import pytest
+
 from transcribe_anything.util import is_mac_arm
 from transcribe_anything.whisper_mac import run_whisper_mac_english, run_whisper_mac_mlx
 
 HERE = Path(os.path.abspath(os.path.dirname(__file__)))
 LOCALFILE_DIR = HERE / "localfile"
-TESTS_DATA_DIR = LOCALFILE_DIR / "text_video_mlx" / "en"
 TEST_WAV = LOCALFILE_DIR / "video.wav"
 
 CAN_RUN_TEST = is_mac_arm()
 
 
+@pytest.fixture
+def bind_mlx_output_dir(request: pytest.FixtureRequest, mlx_output_dir: Path) -> None:
+    """Expose the session MLX run from conftest.py to a unittest test method."""
+    request.instance.mlx_output_dir = mlx_output_dir
+
+
 class MacOsWhisperMLXTester(unittest.TestCase):
     """Tester for transcribe anything with lightning-whisper-mlx (MLX backend)."""
 
+    def setUp(self) -> None:
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
     @unittest.skipUnless(CAN_RUN_TEST, "Not mac")
+    @pytest.mark.usefixtures("bind_mlx_output_dir")
     def test_local_file_english(self) -> None:
-        """Check that the command works on a local file with English."""
-        shutil.rmtree(TESTS_DATA_DIR, ignore_errors=True)
-        run_whisper_mac_mlx(input_wav=TEST_WAV, model="small", output_dir=TESTS_DATA_DIR, language="en", task="transcribe")
+        """Check that the command works on a local file with English.
+
+        Under pytest this reuses the session-wide MLX run, plain unittest transcribes here.
+        """
+        out_dir = getattr(self, "mlx_output_dir", None)
+        if out_dir is None:
+            out_dir = self.test_dir
+            run_whisper_mac_mlx(input_wav=TEST_WAV, model="small", output_dir=out_dir, language="en", task="transcribe")
 
         # Verify output files were created
-        self.assertTrue((TESTS_DATA_DIR / "out.txt").exists())
-        self.assertTrue((TESTS_DATA_DIR / "out.srt").exists())
-        self.assertTrue((TESTS_DATA_DIR / "out.json").exists())
-        self.assertTrue((TESTS_DATA_DIR / "out.vtt").exists())
+        self.assertTrue((out_dir / "out.txt").exists())
+        self.assertTrue((out_dir / "out.srt").exists())
+        self.assertTrue((out_dir / "out.json").exists())
+        self.assertTrue((out_dir / "out.vtt").exists())
 
     @unittest.skipUnless(CAN_RUN_TEST, "Not mac")
     def test_local_file_with_initial_prompt(self) -> None:
         """Check that the command works with initial_prompt (now supported)."""
-        test_dir = LOCALFILE_DIR / "text_video_mlx_prompt"
-        shutil.rmtree(test_dir, ignore_errors=True)
-
         # This should work with initial_prompt support
-        run_whisper_mac_mlx(input_wav=TEST_WAV, model="small", output_dir=test_dir, language="en", task="transcribe", other_args=["--initial_prompt", "test vocabulary terms"])
+        run_whisper_mac_mlx(input_wav=TEST_WAV, model="small", output_dir=self.test_dir, language="en", task="transcribe", other_args=["--initial_prompt", "test vocabulary terms"])
 
         # Verify output files were created
-        self.assertTrue((test_dir / "out.txt").exists())
-        self.assertTrue((test_dir / "out.srt").exists())
-        self.assertTrue((test_dir / "out.json").exists())
+        self.assertTrue((self.test_dir / "out.txt").exists())
+        self.assertTrue((self.test_dir / "out.srt").exists())
+        self.assertTrue((self.test_dir / "out.json").exists())
 
     @unittest.skipUnless(CAN_RUN_TEST, "Not mac")
     def test_backward_compatibility(self) -> None:
         """Check that the old function still works for backward compatibility."""
-        test_dir = LOCALFILE_DIR / "text_video_compat"
-        shutil.rmtree(test_dir, ignore_errors=True)
-
         # Test the old function name
         run_whisper_mac_english(
             input_wav=TEST_WAV,
             model="small",
-            output_dir=test_dir,
+            output_dir=self.test_dir,
         )
 
         # Verify output files were created
-        self.assertTrue((test_dir / "out.txt").exists())
-        self.assertTrue((test_dir / "out.srt").exists())
-        self.assertTrue((test_dir / "out.json").exists())
+        self.assertTrue((self.test_dir / "out.txt").exists())
+        self.assertTrue((self.test_dir / "out.srt").exists())
+        self.assertTrue((self.test_dir / "out.json").exists())
 
     @unittest.skipUnless(CAN_RUN_TEST, "Not mac")
     def test_multilingual_support(self) -> None:
         """Check that multilingual support works (auto-detect)."""
-        test_dir = LOCALFILE_DIR / "text_video_multilingual"
-        shutil.rmtree(test_dir, ignore_errors=True)
-
         # Test with auto-detection (no language specified)
-        run_whisper_mac_mlx(input_wav=TEST_WAV, model="small", output_dir=test_dir, language=None, task="transcribe")  # Auto-detect
+        run_whisper_mac_mlx(input_wav=TEST_WAV, model="small", output_dir=self.test_dir, language=None, task="transcribe")  # Auto-detect
 
         # Verify output files were created
-        self.assertTrue((test_dir / "out.txt").exists())
-        self.assertTrue((test_dir / "out.srt").exists())
-        self.assertTrue((test_dir / "out.json").exists())
+        self.assertTrue((self.test_dir / "out.txt").exists())
+        self.assertTrue((self.test_dir / "out.srt").exists())
+        self.assertTrue((self.test_dir / "out.json").exists())
 
 
 if __name__ == "__main__":
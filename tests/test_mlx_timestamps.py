@@ -15,23 +15,56 @@ Issue Reference: #1 (MLX Mode Timestamp Accuracy)
 """
 from __future__ import annotations
 
-import json
+import functools
 import re
-import shutil
 import sys
 import wave
 from pathlib import Path
 
 import pytest
 
-from transcribe_anything.whisper_mac import _json_to_srt, run_whisper_mac_mlx
+from transcribe_anything.whisper_mac import _json_to_srt
 from transcribe_anything.util import is_mac_arm
 
 HERE = Path(__file__).parent
 LOCALFILE_DIR = HERE / "localfile"
 TEST_WAV = LOCALFILE_DIR / "video.wav"
 REFERENCE_SRT = LOCALFILE_DIR / "video.srt"
-INTEGRATION_OUT = LOCALFILE_DIR / "mlx_timestamp_out"
+
+CAN_RUN_TEST = is_mac_arm()
+
+# Compiled once so the SRT helpers below don't hit the re cache on every call.
+_TS_RANGE_RE = re.compile(r"(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})")
+
+
+def _parse_srt_timestamp(timestamp_str: str) -> float:
+    """Convert an SRT timestamp (HH:MM:SS,mmm) into seconds.
+
+    SRT timestamps are fixed width, so the fields are sliced at known offsets.
+    """
+    return int(timestamp_str[0:2]) * 3600 + int(timestamp_str[3:5]) * 60 + int(timestamp_str[6:8]) + int(timestamp_str[9:12]) / 1000.0
+
+
+def _extract_srt_timestamps(srt_content: str) -> list[tuple[float, float]]:
+    """Return the (start, end) seconds of every subtitle timing line."""
+    return [(_parse_srt_timestamp(start), _parse_srt_timestamp(end)) for start, end in _TS_RANGE_RE.findall(srt_content)]
+
+
+@functools.lru_cache(maxsize=None)
+def _get_audio_duration(wav_file: Path) -> float:
+    """Return the duration of a WAV file in seconds, reading its header only once."""
+    with wave.open(str(wav_file), "rb") as w:
+        return w.getnframes() / w.getframerate()
+
+
+@pytest.fixture(scope="module")
+def mlx_timestamps(mlx_output_dir: Path) -> list[tuple[float, float]]:
+    """SRT timings of the shared session MLX run, read and parsed a single time."""
+    srt_path = mlx_output_dir / "out.srt"
+    assert srt_path.exists(), "SRT file not generated"
+    timestamps = _extract_srt_timestamps(srt_path.read_text(encoding="utf-8"))
+    assert timestamps, "No timestamp lines found in MLX SRT"
+    return timestamps
 
 
 def test_mlx_list_segment_frame_scaling() -> None:
@@ -104,8 +137,8 @@ def test_bug_demonstration_old_vs_new_factor() -> None:
 
 
 @pytest.mark.slow
-@pytest.mark.skipif(not is_mac_arm(), reason="MLX backend only supported / meaningful on Mac ARM")
-def test_integration_mlx_end_time_close_to_wav_duration() -> None:
+@pytest.mark.skipif(not CAN_RUN_TEST, reason="MLX backend only supported / meaningful on Mac ARM")
+def test_integration_mlx_end_time_close_to_wav_duration(mlx_timestamps: list[tuple[float, float]]) -> None:
     """Integration test (Mac ARM only) comparing SRT end time with WAV duration.
 
     Uses existing test audio (video.wav). This test downloads a model ("small")
@@ -113,33 +146,11 @@ def test_integration_mlx_end_time_close_to_wav_duration() -> None:
     may undershoot or overshoot slightly. Bug causes approx 2x stretch → ratio
     outside band.
     """
-    out_dir = INTEGRATION_OUT
-    shutil.rmtree(out_dir, ignore_errors=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    # Run transcription (will populate out.srt)
-    run_whisper_mac_mlx(
-        input_wav=TEST_WAV,
-        model="small",
-        output_dir=out_dir,
-        language="en",
-        task="transcribe",
-    )
-
     # Compute actual WAV duration
-    with wave.open(str(TEST_WAV), "rb") as w:
-        wav_duration = w.getnframes() / w.getframerate()
-
-    srt_path = out_dir / "out.srt"
-    assert srt_path.exists(), "SRT file not generated"
-    srt_content = srt_path.read_text(encoding="utf-8")
+    wav_duration = _get_audio_duration(TEST_WAV)
 
-    # Find last subtitle timing line
-    matches = re.findall(r"(\d{2}):(\d{2}):(\d{2}),(\d{3}) --> (\d{2}):(\d{2}):(\d{2}),(\d{3})", srt_content)
-    assert matches, "No timestamp lines found in SRT"
-    last = matches[-1]
-    h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, last)
-    end_secs = h2 * 3600 + m2 * 60 + s2 + ms2 / 1000.0
+    # End time of the last subtitle
+    end_secs = mlx_timestamps[-1][1]
 
     ratio = end_secs / wav_duration if wav_duration > 0 else 0.0
     # With correct scaling expect ratio roughly near 1 (allow generous band).
@@ -148,8 +159,8 @@ def test_integration_mlx_end_time_close_to_wav_duration() -> None:
 
 
 @pytest.mark.slow
-@pytest.mark.skipif(not is_mac_arm(), reason="MLX backend only supported / meaningful on Mac ARM")
-def test_integration_mlx_vs_reference_srt() -> None:
+@pytest.mark.skipif(not CAN_RUN_TEST, reason="MLX backend only supported / meaningful on Mac ARM")
+def test_integration_mlx_vs_reference_srt(mlx_timestamps: list[tuple[float, float]]) -> None:
     """Integration test comparing MLX output against reference SRT file.
 
     This test runs MLX transcription and compares the timing accuracy against
@@ -159,40 +170,13 @@ def test_integration_mlx_vs_reference_srt() -> None:
     assert REFERENCE_SRT.exists(), f"Reference SRT not found: {REFERENCE_SRT}"
     reference_content = REFERENCE_SRT.read_text(encoding="utf-8")
 
-    # Parse reference timestamps
-    ref_matches = re.findall(r"(\d{2}):(\d{2}):(\d{2}),(\d{3}) --> (\d{2}):(\d{2}):(\d{2}),(\d{3})", reference_content)
-    assert ref_matches, "No timestamps found in reference SRT"
-
-    # Get reference end time
-    ref_last = ref_matches[-1]
-    ref_h1, ref_m1, ref_s1, ref_ms1, ref_h2, ref_m2, ref_s2, ref_ms2 = map(int, ref_last)
-    ref_end_secs = ref_h2 * 3600 + ref_m2 * 60 + ref_s2 + ref_ms2 / 1000.0
-
-    # Run MLX transcription
-    out_dir = INTEGRATION_OUT
-    shutil.rmtree(out_dir, ignore_errors=True)
-    out_dir.mkdir(parents=True, exist_ok=True)
-
-    run_whisper_mac_mlx(
-        input_wav=TEST_WAV,
-        model="small",
-        output_dir=out_dir,
-        language="en",
-        task="transcribe",
-    )
-
-    # Parse MLX output
-    srt_path = out_dir / "out.srt"
-    assert srt_path.exists(), "MLX SRT file not generated"
-    mlx_content = srt_path.read_text(encoding="utf-8")
+    # Parse reference timestamps and get the reference end time
+    ref_timestamps = _extract_srt_timestamps(reference_content)
+    assert ref_timestamps, "No timestamps found in reference SRT"
+    ref_end_secs = ref_timestamps[-1][1]
 
-    mlx_matches = re.findall(r"(\d{2}):(\d{2}):(\d{2}),(\d{3}) --> (\d{2}):(\d{2}):(\d{2}),(\d{3})", mlx_content)
-    assert mlx_matches, "No timestamps found in MLX SRT"
-
-    # Get MLX end time
-    mlx_last = mlx_matches[-1]
-    mlx_h1, mlx_m1, mlx_s1, mlx_ms1, mlx_h2, mlx_m2, mlx_s2, mlx_ms2 = map(int, mlx_last)
-    mlx_end_secs = mlx_h2 * 3600 + mlx_m2 * 60 + mlx_s2 + mlx_ms2 / 1000.0
+    # Get the MLX end time
+    mlx_end_secs = mlx_timestamps[-1][1]
 
     # Compare end times - should be reasonably close
     # Reference ends at 9.460s, so MLX should be in similar range
@@ -206,8 +190,7 @@ def test_integration_mlx_vs_reference_srt() -> None:
     )
 
     # Additional check: MLX end time should be reasonable relative to audio duration
-    with wave.open(str(TEST_WAV), "rb") as w:
-        wav_duration = w.getnframes() / w.getframerate()
+    wav_duration = _get_audio_duration(TEST_WAV)
 
     mlx_ratio = mlx_end_secs / wav_duration
     assert 0.7 <= mlx_ratio <= 1.1, (
@@ -222,24 +205,18 @@ def test_reference_srt_structure_validation() -> None:
     content = REFERENCE_SRT.read_text(encoding="utf-8")
 
     # Parse timestamps
-    matches = re.findall(r"(\d{2}):(\d{2}):(\d{2}),(\d{3}) --> (\d{2}):(\d{2}):(\d{2}),(\d{3})", content)
-    assert len(matches) >= 1, "Reference SRT should have at least one timestamp"
+    timestamps = _extract_srt_timestamps(content)
+    assert len(timestamps) >= 1, "Reference SRT should have at least one timestamp"
 
     # Check that timestamps are reasonable for our 10-second audio
-    last = matches[-1]
-    h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, last)
-    end_secs = h2 * 3600 + m2 * 60 + s2 + ms2 / 1000.0
+    end_secs = timestamps[-1][1]
 
     # Reference should end before the audio duration (9.460s for 10.027s audio)
     assert 8.0 <= end_secs <= 11.0, f"Reference end time seems unreasonable: {end_secs:.3f}s"
 
     # Check that timestamps are in ascending order
     prev_end = 0.0
-    for match in matches:
-        h1, m1, s1, ms1, h2, m2, s2, ms2 = map(int, match)
-        start_secs = h1 * 3600 + m1 * 60 + s1 + ms1 / 1000.0
-        end_secs = h2 * 3600 + m2 * 60 + s2 + ms2 / 1000.0
-
+    for start_secs, end_secs in timestamps:
         assert start_secs >= prev_end, f"Timestamps not in order: {start_secs} should be >= {prev_end}"
         assert end_secs > start_secs, f"End time should be after start time: {end_secs} > {start_secs}"
         prev_end = end_secs
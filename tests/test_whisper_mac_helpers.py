@@ -0,0 +1,63 @@
+"""
+Tests the pure SRT helpers of the MLX backend (no MLX environment needed).
+"""
+
+# pylint: disable=bad-option-value,useless-option-value,no-self-use,protected-access,R0801
+# flake8: noqa E501
+
+import unittest
+
+from transcribe_anything.whisper_mac import _format_timestamp, _json_to_srt, _json_to_srt_with_count
+
+
+class WhisperMacHelpersTester(unittest.TestCase):
+    """Tester for the whisper_mac SRT helpers."""
+
+    def test_format_timestamp_function(self) -> None:
+        """Check that seconds are formatted as HH:MM:SS,mmm."""
+        self.assertEqual(_format_timestamp(0.0), "00:00:00,000")
+        self.assertEqual(_format_timestamp(1.5), "00:00:01,500")
+        self.assertEqual(_format_timestamp(61.25), "00:01:01,250")
+        self.assertEqual(_format_timestamp(3723.456), "01:02:03,456")
+        self.assertEqual(_format_timestamp(36000.0), "10:00:00,000")
+
+    def test_json_to_srt_conversion(self) -> None:
+        """Check list and dict segments are converted and empty text is dropped."""
+        json_data = {
+            "segments": [
+                [0, 100, " Hello "],
+                [100, 200, "   "],
+                {"start": 2.0, "end": 3.5, "text": "World"},
+            ],
+            "text": "Hello World",
+        }
+        srt = _json_to_srt(json_data)
+        # Compare timing and text of each block, not the block index line
+        blocks = [block.split("\n")[1:] for block in srt.strip().split("\n\n")]
+        self.assertEqual(blocks, [["00:00:00,000 --> 00:00:01,000", "Hello"], ["00:00:02,000 --> 00:00:03,500", "World"]])
+
+    def test_json_to_srt_without_segments(self) -> None:
+        """Check the full text becomes a single subtitle when there are no segments."""
+        srt = _json_to_srt({"text": "Only text"})
+        self.assertEqual(srt, "1\n00:00:00,000 --> 00:01:00,000\nOnly text\n\n")
+
+    def test_json_to_srt_with_count(self) -> None:
+        """Check the returned count is the number of blocks written, not the last block index."""
+        json_data = {
+            "segments": [
+                [0, 100, "First"],
+                [100, 200, ""],
+                [300, 200, "Reversed"],
+                {"start": 3.0, "end": 4.0, "text": "Last"},
+            ],
+        }
+        srt, count = _json_to_srt_with_count(json_data)
+        self.assertEqual(count, 2)
+        self.assertEqual(count, srt.count(" --> "))
+        self.assertEqual(srt, _json_to_srt(json_data))
+        self.assertEqual(_json_to_srt_with_count({"text": "Only text"})[1], 1)
+        self.assertEqual(_json_to_srt_with_count({}), ("", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()